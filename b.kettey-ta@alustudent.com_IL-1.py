@@ -3,8 +3,54 @@
 # Individual Coding Lab (Summatives) Benjamin Kettey-Tagoe
 #==================================================================
 
+import bisect
 import json
-from typing import Dict, List, Tuple, Sequence
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Sequence
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard library json module is used otherwise
+    orjson = None
+
+# Performance feedback: messages[i] applies to GPAs in [tiers[i-1], tiers[i])
+_GPA_FEEDBACK_TIERS = (3.0, 3.5, 4.0, 4.5)
+_GPA_FEEDBACK_MESSAGES = (
+    "You passed, but there's room for improvement. GPA: {gpa:.3f}",
+    "Satisfactory work with a GPA of {gpa:.3f}!",
+    "Good performance with a GPA of {gpa:.3f}!",
+    "Excellent work with a GPA of {gpa:.3f}!",
+    "Outstanding performance with a GPA of {gpa:.3f}!",
+)
+
+# One assignment row in the report; the trailing newline leaves a blank
+# line after the row once report lines are joined
+_REPORT_ROW_TEMPLATE = "%d. %s\nGrade: %.2f%% | Weight: %.2f%% | %s\nPoints contributed: %.2f\n"
+
+# Score range and GPA for a single letter grade
+GradeBucket = namedtuple('GradeBucket', ['min', 'max', 'gpa'])
+
+
+def _json_dumps(obj) -> str:
+    """
+    Serialize to an indented JSON string, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _json_loads(data):
+    """
+    Parse a JSON str or bytes, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class GradingScale:
     """
@@ -16,41 +62,57 @@ class GradingScale:
         Initialize with default ALU grading scale
         """
         self.scale = {
-            'A+': {'min': 98, 'max': 100, 'gpa': 5.0},
-            'A':  {'min': 89.99, 'max': 97.00, 'gpa': 4.8},
-            'A-': {'min': 80, 'max': 96.99, 'gpa': 4.7},
-            'B+': {'min': 75, 'max': 79.99, 'gpa': 4.3},
-            'B':  {'min': 70, 'max': 74.99, 'gpa': 4.0},
-            'B-': {'min': 65, 'max': 69.99, 'gpa': 3.7},
-            'C+': {'min': 60, 'max': 64.99, 'gpa': 3.3},
-            'C':  {'min': 55, 'max': 59.99, 'gpa': 3.0},
-            'C-': {'min': 50, 'max': 54.99, 'gpa': 2.7},
-            'D':  {'min': 40, 'max': 49.99, 'gpa': 2.0},
-            'F':  {'min': 0,  'max': 39.99, 'gpa': 1.0}
+            'A+': GradeBucket(98, 100, 5.0),
+            'A':  GradeBucket(89.99, 97.00, 4.8),
+            'A-': GradeBucket(80, 96.99, 4.7),
+            'B+': GradeBucket(75, 79.99, 4.3),
+            'B':  GradeBucket(70, 74.99, 4.0),
+            'B-': GradeBucket(65, 69.99, 3.7),
+            'C+': GradeBucket(60, 64.99, 3.3),
+            'C':  GradeBucket(55, 59.99, 3.0),
+            'C-': GradeBucket(50, 54.99, 2.7),
+            'D':  GradeBucket(40, 49.99, 2.0),
+            'F':  GradeBucket(0,  39.99, 1.0)
         }
         self.max_gpa = 5.0
         self.passing_threshold = 50.0
-        self._validate_scale()
+        self._grade_cache: Dict[float, Tuple[float, str]] = {}
+        self._scale_display_cache: Optional[str] = None
+        # Edits collected by batch_update, validated when the batch ends
+        self._pending_scale: Optional[Dict[str, GradeBucket]] = None
+        self._validate_scale(self.scale)
     
-    def _validate_scale(self):
+    def _validate_scale(self, scale: Dict[str, GradeBucket]):
         """
-        Validate the grading scale for consistency
+        Validate a grading scale for consistency and make it the current scale.
+        The current scale and its lookup data are left untouched if it is invalid.
         """
         # Check for overlaps and gaps
-        all_ranges = []
-        for letter, data in self.scale.items():
-            if data['min'] > data['max']:
+        for letter, data in scale.items():
+            if data.min > data.max:
                 raise ValueError(f"Invalid range for grade {letter}: min > max")
-            if data['gpa'] > self.max_gpa or data['gpa'] < 0:
+            if data.gpa > self.max_gpa or data.gpa < 0:
                 raise ValueError(f"Invalid GPA for grade {letter}: must be between 0 and {self.max_gpa}")
-            all_ranges.append((data['min'], data['max'], letter))
         
-        # Sort by minimum value
-        all_ranges.sort(key=lambda x: x[0])
+        # Sort once by minimum value; every lookup structure below is derived from this
+        boundaries_asc = tuple(sorted(
+            ((letter, data.min, data.max, data.gpa) for letter, data in scale.items()),
+            key=lambda x: x[1]))
         
         # Check for coverage from 0 to 100
-        if all_ranges[0][0] != 0 or all_ranges[-1][1] != 100:
+        if boundaries_asc[0][1] != 0 or boundaries_asc[-1][2] != 100:
             print("Warning: Grading scale may not cover full 0-100 range")
+        
+        # The scale is valid: switch to it and rebuild everything derived from it
+        self.scale = scale
+        self._boundaries_asc = boundaries_asc
+        self._mins = [min_score for _, min_score, _, _ in boundaries_asc]
+        self._buckets = [(max_score, gpa, letter) for letter, _, max_score, gpa in boundaries_asc]
+        self._grade_cache.clear()
+        self._scale_display_cache = None
+        
+        # Descending order for display purposes
+        self._boundaries_desc = boundaries_asc[::-1]
     
     def percentage_to_grade(self, percentage: float) -> Tuple[float, str]:
         """
@@ -59,10 +121,22 @@ class GradingScale:
         # Clamp percentage to valid range
         percentage = max(0.0, min(100.0, float(percentage)))
         
-        # Find the appropriate grade
-        for letter, data in self.scale.items():
-            if data['min'] <= percentage <= data['max']:
-                return data['gpa'], letter
+        cached = self._grade_cache.get(percentage)
+        if cached is not None:
+            return cached
+        
+        # Binary search for the highest grade whose minimum is reached; ranges may
+        # overlap, so if that grade's maximum is exceeded, walk down to the first
+        # lower grade whose range still covers the percentage
+        i = bisect.bisect_right(self._mins, percentage) - 1
+        while i >= 0:
+            max_score, gpa, letter = self._buckets[i]
+            if percentage <= max_score:
+                if len(self._grade_cache) > 2048:
+                    self._grade_cache.clear()
+                self._grade_cache[percentage] = (gpa, letter)
+                return gpa, letter
+            i -= 1
         
         # should not reach here if scale is properly configured
         print(f"Warning: No grade found for {percentage}%. Using minimum grade.")
@@ -72,54 +146,95 @@ class GradingScale:
         """
         Check if a percentage is passing
         """
-        return float(percentage) >= self.passing_threshold
+        return percentage >= self.passing_threshold
     
-    def get_grade_boundaries(self) -> List[Tuple[str, float, float, float]]:
+    def passing_mask(self, percentages: Sequence[float]) -> List[bool]:
         """
-        Get all grade boundaries in a sorted list
-        Returns: List of (letter, min, max, gpa) tuples
+        Check a batch of percentages against the passing threshold
         """
-        boundaries = []
-        for letter, data in self.scale.items():
-            boundaries.append((letter, data['min'], data['max'], data['gpa']))
-        
-        # Sort by minimum score (descending for display purposes)
-        boundaries.sort(key=lambda x: x[1], reverse=True)
-        return boundaries
+        threshold = self.passing_threshold
+        return [percentage >= threshold for percentage in percentages]
+    
+    def get_grade_boundaries(self) -> Tuple[Tuple[str, float, float, float], ...]:
+        """
+        Get all grade boundaries sorted by minimum score, highest first
+        Returns: Tuple of (letter, min, max, gpa) tuples
+        """
+        return self._boundaries_desc
+    
+    def format_boundaries(self) -> str:
+        """
+        Get the grade boundaries formatted as reference table rows
+        """
+        if self._scale_display_cache is None:
+            rows = []
+            for letter, min_score, max_score, gpa in self.get_grade_boundaries():
+                if max_score == 100:
+                    rows.append(f"{min_score:2.0f}-{max_score:3.0f}%        |   {letter:2s}   | {gpa:.1f}")
+                else:
+                    rows.append(f"{min_score:2.0f}-{max_score:5.2f}%    |   {letter:2s}   | {gpa:.1f}")
+            self._scale_display_cache = "\n".join(rows)
+        return self._scale_display_cache
     
     def update_grade(self, letter: str, min_score: float, max_score: float, gpa: float):
         """
         Update a specific grade in the scale
         """
-        if letter not in self.scale:
+        pending = self._pending_scale
+        if letter not in (self.scale if pending is None else pending):
             print(f"Adding new grade: {letter}")
         
-        self.scale[letter] = {
-            'min': min_score,
-            'max': max_score,
-            'gpa': gpa
-        }
-        self._validate_scale()
+        if pending is not None:
+            pending[letter] = GradeBucket(min_score, max_score, gpa)
+        else:
+            scale = dict(self.scale)
+            scale[letter] = GradeBucket(min_score, max_score, gpa)
+            self._validate_scale(scale)
+    
+    @contextmanager
+    def batch_update(self):
+        """
+        Apply several update_grade calls and validate them once, when the block exits normally.
+        Until then the scale, grade lookups and exports stay as last validated; if the
+        block raises, the collected updates are discarded.
+        """
+        if self._pending_scale is not None:
+            # Already inside a batch; the outer one validates
+            yield self
+            return
+        
+        self._pending_scale = dict(self.scale)
+        try:
+            yield self
+            pending = self._pending_scale
+        finally:
+            self._pending_scale = None
+        self._validate_scale(pending)
     
     def export_scale(self) -> str:
         """
         Export scale to JSON string for backup/sharing
         """
-        return json.dumps(self.scale, indent=2)
+        return _json_dumps({letter: bucket._asdict() for letter, bucket in self.scale.items()})
     
     def import_scale(self, json_str: str):
         """
         Import scale from JSON string
+        The imported scale is validated straight away, even inside batch_update
         """
         try:
-            imported_scale = json.loads(json_str)
+            imported_scale = _json_loads(json_str)
             # Validate structure
             for letter, data in imported_scale.items():
                 if not all(key in data for key in ['min', 'max', 'gpa']):
                     raise ValueError(f"Invalid structure for grade {letter}")
             
-            self.scale = imported_scale
-            self._validate_scale()
+            scale = {letter: GradeBucket(data['min'], data['max'], data['gpa'])
+                     for letter, data in imported_scale.items()}
+            self._validate_scale(scale)
+            if self._pending_scale is not None:
+                # Later updates in the same batch build on the imported scale
+                self._pending_scale = dict(self.scale)
             print("Grading scale imported successfully!")
         except (json.JSONDecodeError, ValueError) as e:
             print(f"Error importing scale: {e}")
@@ -130,6 +245,8 @@ class Assignment:
     Assignment class with validation and error handling
     """
     
+    __slots__ = ('name', 'weight', 'grade')
+    
     def __init__(self, name: str, weight: float, grade: float):
         """
         Initialize assignment with validation
@@ -137,7 +254,6 @@ class Assignment:
         self.name = self._validate_name(name)
         self.weight = self._validate_weight(weight)
         self.grade = self._validate_grade(grade)
-        self.points = self.calculate_points()
     
     def _validate_name(self, name: str) -> str:
         """
@@ -165,25 +281,24 @@ class Assignment:
             raise ValueError("Grade must be between 0 and 100")
         return grade
     
-    def calculate_points(self) -> float:
+    @property
+    def points(self) -> float:
         """
-        Calculate weighted points
+        Weighted points, computed from the current grade and weight
         """
         return (self.grade * self.weight) / 100.0
     
     def update_grade(self, new_grade: float):
         """
-        Update the grade and recalculate points
+        Update the grade
         """
         self.grade = self._validate_grade(new_grade)
-        self.points = self.calculate_points()
     
     def update_weight(self, new_weight: float):
         """
-        Update the weight and recalculate points
+        Update the weight
         """
         self.weight = self._validate_weight(new_weight)
-        self.points = self.calculate_points()
     
     def get_info(self) -> Dict:
         """
@@ -202,6 +317,8 @@ class FormativeAssignment(Assignment):
     Formative Assignment class
     """
     
+    __slots__ = ('assignment_type', 'description')
+    
     def __init__(self, name: str, weight: float, grade: float):
         super().__init__(name, weight, grade)
         self.assignment_type = "FA"
@@ -222,6 +339,8 @@ class SummativeAssignment(Assignment):
     Summative Assignment class
     """
     
+    __slots__ = ('assignment_type', 'description')
+    
     def __init__(self, name: str, weight: float, grade: float):
         super().__init__(name, weight, grade)
         self.assignment_type = "SA"
@@ -237,6 +356,24 @@ class SummativeAssignment(Assignment):
             return f"Focus on improving for {self.name} - it's crucial for passing!"
 
 
+def _category_stats(assignments: Sequence[Assignment]) -> Tuple[float, float, float]:
+    """
+    Compute (percentage, total weight, weighted points) for one category
+    """
+    total_weight = 0.0
+    total_grade_weight = 0.0
+    for assignment in assignments:
+        weight = assignment.weight
+        total_weight += weight
+        total_grade_weight += assignment.grade * weight
+    
+    # Handle division by zero. Dividing sum(weight * grade) by the total weight
+    # directly (rather than scaling points by /100 and back by *100) keeps e.g.
+    # all-50% grades at exactly 50.0 instead of 49.999...
+    percentage = 0.0 if total_weight == 0 else total_grade_weight / total_weight
+    return percentage, total_weight, total_grade_weight / 100.0
+
+
 class GPACalculator:
     """
     Enhanced GPA calculator with flexible grading scale
@@ -258,14 +395,7 @@ class GPACalculator:
                 'weighted_points': 0.0
             }
         
-        total_points = sum(assignment.points for assignment in assignments)
-        total_weight = sum(assignment.weight for assignment in assignments)
-        
-        # Calculate percentage (handle division by zero)
-        if total_weight == 0:
-            percentage = 0.0
-        else:
-            percentage = (total_points / total_weight) * 100
+        percentage, total_weight, total_points = _category_stats(assignments)
         
         # Ensure percentage is within bounds
         percentage = max(0.0, min(100.0, percentage))
@@ -355,13 +485,46 @@ class GradeCalculator:
             print(f"Error adding assignment: {e}")
             return False
     
+    def add_bulk(self, kind: str, names: Sequence[str], weights: Sequence[float], grades: Sequence[float]) -> bool:
+        """
+        Add many assignments of one kind ("FA" or "SA") at once, e.g. from a script.
+        Nothing is added unless every assignment in the batch is valid.
+        """
+        try:
+            if kind == "FA":
+                assignment_class = FormativeAssignment
+                target = self.formative_assignments
+            elif kind == "SA":
+                assignment_class = SummativeAssignment
+                target = self.summative_assignments
+            else:
+                raise ValueError("Assignment kind must be 'FA' or 'SA'")
+            
+            if not len(names) == len(weights) == len(grades):
+                raise ValueError("Names, weights and grades must have the same length")
+            
+            # Build (and so validate) every assignment before adding any of them
+            new_assignments = [assignment_class(name, weight, grade)
+                               for name, weight, grade in zip(names, weights, grades)]
+            
+            target.extend(new_assignments)
+            
+            print(f"\nAdded {len(new_assignments)} assignments to your {kind} assignments!")
+            return True
+        except (TypeError, ValueError) as e:
+            print(f"Error adding assignments: {e}")
+            return False
+    
     def generate_report(self):
         """
         Generate comprehensive grade report
         """
-        print("\n" + "=" * 60)
-        print(f"COMPREHENSIVE GRADE REPORT FOR {self.student_name.upper()}")
-        print("=" * 60)
+        # Write the header first so that any warnings printed while grading
+        # land inside the report, then collect the rest and write it in one go
+        sys.stdout.write("\n" + "=" * 60 + "\n"
+                         f"COMPREHENSIVE GRADE REPORT FOR {self.student_name.upper()}\n"
+                         + "=" * 60 + "\n")
+        lines: List[str] = []
         
         # Calculate results
         fa_result = self.gpa_calculator.calculate_category_gpa(self.formative_assignments)
@@ -369,59 +532,60 @@ class GradeCalculator:
         overall_result = self.gpa_calculator.calculate_overall_gpa(fa_result, sa_result)
         
         # Display sections
-        self._display_category_section("FORMATIVE ASSIGNMENTS (FA)", self.formative_assignments, fa_result)
-        self._display_category_section("SUMMATIVE ASSIGNMENTS (SA)", self.summative_assignments, sa_result)
-        self._display_final_results(overall_result)
-        self._display_grading_scale()
+        self._display_category_section(lines, "FORMATIVE ASSIGNMENTS (FA)", self.formative_assignments, fa_result)
+        self._display_category_section(lines, "SUMMATIVE ASSIGNMENTS (SA)", self.summative_assignments, sa_result)
+        self._display_final_results(lines, overall_result)
+        self._display_grading_scale(lines)
         
-        print("\n" + "=" * 60)
+        lines.append("\n" + "=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def _display_category_section(self, title: str, assignments: Sequence[Assignment], result: Dict):
+    def _display_category_section(self, lines: List[str], title: str, assignments: Sequence[Assignment], result: Dict):
         """
         Display a category section (FA or SA)
         """
-        print(f"\n{title}:")
-        print("-" * 50)
+        lines.append(f"\n{title}:")
+        lines.append("-" * 50)
+        
+        passing_threshold = self.grading_scale.passing_threshold
         
         if assignments:
             for i, assignment in enumerate(assignments, 1):
-                info = assignment.get_info()
-                status = "PASS" if self.grading_scale.is_passing(info['grade']) else "FAIL"
-                print(f"{i}. {info['name']}")
-                print(f"Grade: {info['grade']:.2f}% | Weight: {info['weight']:.2f}% | {status}")
-                print(f"Points contributed: {info['points']:.2f}")
-                print()
+                grade = assignment.grade
+                status = "PASS" if grade >= passing_threshold else "FAIL"
+                lines.append(_REPORT_ROW_TEMPLATE % (i, assignment.name, grade, assignment.weight,
+                                                    status, assignment.points))
             
-            print(f"CATEGORY SUMMARY:")
-            print(f"Total Score: {result['total_percentage']:.2f}%")
-            print(f"Letter Grade: {result['letter_grade']}")
-            print(f"GPA: {result['gpa']:.2f}/{self.grading_scale.max_gpa}")
-            print(f"Total Weight: {result['total_weight']:.2f}%")
-            status = "PASS" if self.grading_scale.is_passing(result['total_percentage']) else "FAIL"
-            print(f"Status: {status}")
+            lines.append(f"CATEGORY SUMMARY:")
+            lines.append(f"Total Score: {result['total_percentage']:.2f}%")
+            lines.append(f"Letter Grade: {result['letter_grade']}")
+            lines.append(f"GPA: {result['gpa']:.2f}/{self.grading_scale.max_gpa}")
+            lines.append(f"Total Weight: {result['total_weight']:.2f}%")
+            status = "PASS" if result['total_percentage'] >= passing_threshold else "FAIL"
+            lines.append(f"Status: {status}")
         else:
-            print("No assignments added yet.")
+            lines.append("No assignments added yet.")
     
-    def _display_final_results(self, overall_result: Dict):
+    def _display_final_results(self, lines: List[str], overall_result: Dict):
         """
         Display final results and pass/fail determination
         """
-        print(f"\nFINAL ACADEMIC RESULTS:")
-        print("-" * 40)
+        lines.append(f"\nFINAL ACADEMIC RESULTS:")
+        lines.append("-" * 40)
         
         fa_data = overall_result['fa_data']
         sa_data = overall_result['sa_data']
         
-        print(f"FA Category: {fa_data['total_percentage']:.2f}% | GPA: {fa_data['gpa']:.2f} ({fa_data['letter_grade']})")
-        print(f"SA Category: {sa_data['total_percentage']:.2f}% | GPA: {sa_data['gpa']:.2f} ({sa_data['letter_grade']})")
-        print(f"Overall Percentage: {overall_result['overall_percentage']:.2f}%")
-        print(f"Overall Letter Grade: {overall_result['overall_letter']}")
-        print(f"Overall GPA: {overall_result['overall_gpa']:.3f}/{self.grading_scale.max_gpa}")
+        lines.append(f"FA Category: {fa_data['total_percentage']:.2f}% | GPA: {fa_data['gpa']:.2f} ({fa_data['letter_grade']})")
+        lines.append(f"SA Category: {sa_data['total_percentage']:.2f}% | GPA: {sa_data['gpa']:.2f} ({sa_data['letter_grade']})")
+        lines.append(f"Overall Percentage: {overall_result['overall_percentage']:.2f}%")
+        lines.append(f"Overall Letter Grade: {overall_result['overall_letter']}")
+        lines.append(f"Overall GPA: {overall_result['overall_gpa']:.3f}/{self.grading_scale.max_gpa}")
         
         # Pass/fail determination
-        self._determine_pass_fail(fa_data, sa_data, overall_result)
+        self._determine_pass_fail(lines, fa_data, sa_data, overall_result)
     
-    def _determine_pass_fail(self, fa_data: Dict, sa_data: Dict, overall_result: Dict):
+    def _determine_pass_fail(self, lines: List[str], fa_data: Dict, sa_data: Dict, overall_result: Dict):
         """
         Determine if student passes based on ALU rules
         """
@@ -429,69 +593,58 @@ class GradeCalculator:
         sa_percentage = sa_data['total_percentage']
         has_fa = len(self.formative_assignments) > 0
         has_sa = len(self.summative_assignments) > 0
+        passing_threshold = self.grading_scale.passing_threshold
+        fa_pass = fa_percentage >= passing_threshold
+        sa_pass = sa_percentage >= passing_threshold
         
         if has_fa and has_sa:
             # Both categories - need 50% in both
-            fa_pass = self.grading_scale.is_passing(fa_percentage)
-            sa_pass = self.grading_scale.is_passing(sa_percentage)
-            
             if fa_pass and sa_pass:
-                print(f"\nCONGRATULATIONS! YOU PASSED THE COURSE!")
-                print("Both your FA and SA categories meet the minimum requirement!")
-                self._provide_performance_feedback(overall_result['overall_gpa'])
+                lines.append(f"\nCONGRATULATIONS! YOU PASSED THE COURSE!")
+                lines.append("Both your FA and SA categories meet the minimum requirement!")
+                self._provide_performance_feedback(lines, overall_result['overall_gpa'])
             else:
-                print(f"\nUNFORTUNATELY, YOU NEED TO REPEAT THIS COURSE")
-                print(f"You need at least {self.grading_scale.passing_threshold}% in BOTH FA and SA to pass")
+                lines.append(f"\nUNFORTUNATELY, YOU NEED TO REPEAT THIS COURSE")
+                lines.append(f"You need at least {passing_threshold}% in BOTH FA and SA to pass")
                 if not fa_pass:
-                    print(f"Your FA total ({fa_percentage:.2f}%) is below {self.grading_scale.passing_threshold}%")
+                    lines.append(f"Your FA total ({fa_percentage:.2f}%) is below {passing_threshold}%")
                 if not sa_pass:
-                    print(f"Your SA total ({sa_percentage:.2f}%) is below {self.grading_scale.passing_threshold}%")
+                    lines.append(f"Your SA total ({sa_percentage:.2f}%) is below {passing_threshold}%")
         elif has_fa or has_sa:
             # Only one category
-            category_name = "FA" if has_fa else "SA"
-            percentage = fa_percentage if has_fa else sa_percentage
+            if has_fa:
+                category_name, other_name, percentage, passed = "FA", "SA", fa_percentage, fa_pass
+            else:
+                category_name, other_name, percentage, passed = "SA", "FA", sa_percentage, sa_pass
             
-            print(f"\nCURRENT {category_name} PROGRESS:")
-            if self.grading_scale.is_passing(percentage):
-                print(f"Great! Your {category_name} score ({percentage:.2f}%) meets the requirement!")
-                print(f"Add {('SA' if has_fa else 'FA')} assignments to get your complete course grade.")
+            lines.append(f"\nCURRENT {category_name} PROGRESS:")
+            if passed:
+                lines.append(f"Great! Your {category_name} score ({percentage:.2f}%) meets the requirement!")
+                lines.append(f"Add {other_name} assignments to get your complete course grade.")
             else:
-                print(f"Your {category_name} score ({percentage:.2f}%) is below {self.grading_scale.passing_threshold}%. Keep working!")
+                lines.append(f"Your {category_name} score ({percentage:.2f}%) is below {passing_threshold}%. Keep working!")
         else:
-            print(f"\nNo assignments added yet. Add some assignments to see your progress!")
+            lines.append(f"\nNo assignments added yet. Add some assignments to see your progress!")
     
-    def _provide_performance_feedback(self, gpa: float):
+    def _provide_performance_feedback(self, lines: List[str], gpa: float):
         """
         Provide performance feedback based on GPA
         """
-        if gpa >= 4.5:
-            print(f"Outstanding performance with a GPA of {gpa:.3f}!")
-        elif gpa >= 4.0:
-            print(f"Excellent work with a GPA of {gpa:.3f}!")
-        elif gpa >= 3.5:
-            print(f"Good performance with a GPA of {gpa:.3f}!")
-        elif gpa >= 3.0:
-            print(f"Satisfactory work with a GPA of {gpa:.3f}!")
-        else:
-            print(f"You passed, but there's room for improvement. GPA: {gpa:.3f}")
+        tier = bisect.bisect_right(_GPA_FEEDBACK_TIERS, gpa)
+        lines.append(_GPA_FEEDBACK_MESSAGES[tier].format(gpa=gpa))
     
-    def _display_grading_scale(self):
+    def _display_grading_scale(self, lines: List[str]):
         """
         Display the current grading scale
         """
-        print(f"\nGRADING SCALE REFERENCE:")
-        print("-" * 45)
-        print("Score Range     | Letter | GPA")
-        print("-" * 45)
+        lines.append(f"\nGRADING SCALE REFERENCE:")
+        lines.append("-" * 45)
+        lines.append("Score Range     | Letter | GPA")
+        lines.append("-" * 45)
         
-        boundaries = self.grading_scale.get_grade_boundaries()
-        for letter, min_score, max_score, gpa in boundaries:
-            if max_score == 100:
-                print(f"{min_score:2.0f}-{max_score:3.0f}%        |   {letter:2s}   | {gpa:.1f}")
-            else:
-                print(f"{min_score:2.0f}-{max_score:5.2f}%    |   {letter:2s}   | {gpa:.1f}")
-        print(f"Maximum GPA: {self.grading_scale.max_gpa}")
-        print(f"Passing threshold: {self.grading_scale.passing_threshold}%")
+        lines.append(self.grading_scale.format_boundaries())
+        lines.append(f"Maximum GPA: {self.grading_scale.max_gpa}")
+        lines.append(f"Passing threshold: {self.grading_scale.passing_threshold}%")
     
     def has_assignments(self) -> bool:
         """
@@ -507,16 +660,18 @@ class GradeCalculator:
         print("-" * 30)
         
         try:
-            fa_score = float(input("Enter your FA total score (0-100): "))
-            sa_score = float(input("Enter your SA total score (0-100): "))
+            fa_score = _parse_number(input("Enter your FA total score (0-100): "))
+            sa_score = _parse_number(input("Enter your SA total score (0-100): "))
             
             if not (0 <= fa_score <= 100) or not (0 <= sa_score <= 100):
                 print("Please enter scores between 0 and 100!")
                 return
             
             # Create temporary results
-            fa_result = {'total_percentage': fa_score, 'gpa': self.grading_scale.percentage_to_grade(fa_score)[0], 'letter_grade': self.grading_scale.percentage_to_grade(fa_score)[1]}
-            sa_result = {'total_percentage': sa_score, 'gpa': self.grading_scale.percentage_to_grade(sa_score)[0], 'letter_grade': self.grading_scale.percentage_to_grade(sa_score)[1]}
+            fa_gpa, fa_letter = self.grading_scale.percentage_to_grade(fa_score)
+            sa_gpa, sa_letter = self.grading_scale.percentage_to_grade(sa_score)
+            fa_result = {'total_percentage': fa_score, 'gpa': fa_gpa, 'letter_grade': fa_letter}
+            sa_result = {'total_percentage': sa_score, 'gpa': sa_gpa, 'letter_grade': sa_letter}
             
             overall_result = self.gpa_calculator.calculate_overall_gpa(fa_result, sa_result)
             
@@ -534,6 +689,13 @@ class GradeCalculator:
 
 # Utility functions for input validation
 
+def _parse_number(raw: str) -> float:
+    """
+    Parse a number typed by the user, tolerating spaces and a trailing %
+    """
+    return float(raw.strip().rstrip('%'))
+
+
 def get_student_name() -> str:
     """
     Get and validate student name
@@ -548,7 +710,7 @@ def get_student_name() -> str:
             print("Your name cannot be just numbers! Please enter your actual name.")
             continue
         
-        if not any(char.isalpha() for char in name):
+        if not any(map(str.isalpha, name)):
             print("Your name must contain at least one letter!")
             continue
         
@@ -574,7 +736,7 @@ def get_assignment_details() -> Tuple[str, float, float]:
             print("Assignment name cannot be just numbers! Please enter a descriptive name.")
             continue
         
-        if not any(char.isalpha() for char in name):
+        if not any(map(str.isalpha, name)):
             print("Assignment name must contain at least one letter!")
             continue
         
@@ -584,23 +746,38 @@ def get_assignment_details() -> Tuple[str, float, float]:
             
         break
     
-    # Get assignment weight
+    # Get assignment weight, optionally followed by the grade (e.g. "10, 85")
+    grade = None
     while True:
+        raw = input("Enter the weight as a percentage (e.g., 10 for 10%), "
+                    "or weight and grade (e.g., 10, 85): ")
+        weight_text, comma, grade_text = raw.partition(',')
+        if comma and not grade_text[:1].isspace():
+            # "12,5" could be a decimal comma; don't guess it means weight 12, grade 5
+            print("Use a decimal point for decimals, or a comma and a space between weight and grade (e.g., 10, 85)!")
+            continue
         try:
-            weight = float(input("Enter the weight as a percentage (e.g., 10 for 10%): "))
-            if 0 < weight <= 100:
-                break
-            else:
-                print("Please enter a number between 0.1 and 100!")
+            weight = _parse_number(weight_text)
+            grade = _parse_number(grade_text) if comma else None
         except ValueError:
             print("Please enter a valid number!")
+            continue
+        
+        if 0 < weight <= 100:
+            break
+        else:
+            print("Please enter a number between 0.1 and 100!")
     
-    # Get assignment grade
-    while True:
+    if grade is not None and not 0 <= grade <= 100:
+        print("Please enter a grade between 0 and 100!")
+        grade = None
+    
+    # Get assignment grade, unless it was entered together with the weight
+    while grade is None:
         try:
-            grade = float(input("Enter your grade out of 100 (e.g., 85 for 85%): "))
-            if 0 <= grade <= 100:
-                break
+            value = _parse_number(input("Enter your grade out of 100 (e.g., 85 for 85%): "))
+            if 0 <= value <= 100:
+                grade = value
             else:
                 print("Please enter a grade between 0 and 100!")
         except ValueError: